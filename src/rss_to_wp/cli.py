@@ -22,12 +22,19 @@ from rss_to_wp.feeds import (
     get_entry_content,
     get_entry_link,
     get_entry_title,
-    parse_feed,
+    parse_feeds,
     pick_entries,
 )
-from rss_to_wp.images import download_image, find_fallback_image, find_rss_image, scrape_image_from_url
+from rss_to_wp.images import (
+    download_image,
+    download_images,
+    find_fallback_image,
+    find_rss_image,
+    scrape_image_from_url,
+    scrape_images_batch,
+)
 from rss_to_wp.rewriter import OpenAIRewriter
-from rss_to_wp.storage import DedupeStore
+from rss_to_wp.storage import DedupeStore, FeedCache
 from rss_to_wp.utils import get_logger, setup_logging, send_email_notification, build_summary_email
 from rss_to_wp.wordpress import WordPressClient
 
@@ -158,10 +165,14 @@ def run(
     total_errors = 0
     published_articles: list[dict] = []  # Track for email notification
 
+    # Fetch all feeds up front (concurrently), then process them one by one
+    parsed_feeds = parse_feeds([f.url for f in feeds], cache=FeedCache())
+
     for feed_config in feeds:
         try:
             processed, skipped, errors = process_feed(
                 feed_config=feed_config,
+                feed=parsed_feeds.get(feed_config.url),
                 settings=settings,
                 dedupe_store=dedupe_store,
                 rewriter=rewriter,
@@ -227,6 +238,7 @@ def run(
 
 def process_feed(
     feed_config: FeedConfig,
+    feed: Optional[dict],
     settings: AppSettings,
     dedupe_store: DedupeStore,
     rewriter: OpenAIRewriter,
@@ -237,7 +249,7 @@ def process_feed(
     config_path: str = "",
     published_articles: Optional[list[dict]] = None,
 ) -> tuple[int, int, int]:
-    """Process a single feed.
+    """Process a single, already parsed feed.
 
     Returns:
         Tuple of (processed_count, skipped_count, error_count)
@@ -248,8 +260,6 @@ def process_feed(
     skipped = 0
     errors = 0
 
-    # Parse feed
-    feed = parse_feed(feed_config.url)
     if not feed or not feed.entries:
         logger.warning("feed_empty_or_failed", name=feed_config.name)
         return (0, 0, 1)
@@ -268,6 +278,10 @@ def process_feed(
 
     logger.info("entries_to_process", name=feed_config.name, count=len(entries))
 
+    # Fetch images for new entries concurrently, ahead of the sequential
+    # rewrite/publish loop
+    rss_images, scraped_images = prefetch_images(entries, feed_config, dedupe_store)
+
     for entry in entries:
         try:
             # Generate unique key
@@ -293,6 +307,8 @@ def process_feed(
                 dry_run=dry_run,
                 logger=logger,
                 config_path=config_path,
+                rss_images=rss_images,
+                scraped_images=scraped_images,
             )
 
             if result:
@@ -338,6 +354,43 @@ def process_feed(
     return (processed, skipped, errors)
 
 
+def prefetch_images(
+    entries: list,
+    feed_config: FeedConfig,
+    dedupe_store: DedupeStore,
+) -> tuple[dict[str, Optional[tuple[bytes, str, str]]], dict[str, Optional[str]]]:
+    """Fetch the images of not-yet-processed entries concurrently.
+
+    RSS images are downloaded; the source pages of entries without an RSS
+    image are scraped.
+
+    Returns:
+        Tuple of (mapping of RSS image URL to download result, mapping of
+        article URL to scraped image URL). Failed downloads, pages without
+        an image and scrapes cut off by the batch deadline map to None.
+    """
+    # Entries with a feed default image never use their RSS image
+    if feed_config.default_image:
+        return {}, {}
+
+    image_urls = []
+    page_urls = []
+    for entry in entries:
+        if dedupe_store.is_processed(generate_entry_key(entry, feed_config.url)):
+            continue
+        link = get_entry_link(entry)
+        image_url = find_rss_image(entry, base_url=link or "")
+        if image_url:
+            image_urls.append(image_url)
+        elif link:
+            page_urls.append(link)
+
+    scraped_images = scrape_images_batch(page_urls)
+
+    image_urls = list(dict.fromkeys(image_urls))
+    return dict(zip(image_urls, download_images(image_urls))), scraped_images
+
+
 def process_entry(
     entry,
     feed_config: FeedConfig,
@@ -347,6 +400,8 @@ def process_entry(
     dry_run: bool,
     logger,
     config_path: str = "",
+    rss_images: Optional[dict[str, Optional[tuple[bytes, str, str]]]] = None,
+    scraped_images: Optional[dict[str, Optional[str]]] = None,
 ) -> Optional[dict]:
     """Process a single RSS entry.
 
@@ -397,13 +452,21 @@ def process_entry(
 
         if image_url:
             logger.info("using_rss_image", url=image_url)
-            image_result = download_image(image_url)
+            if rss_images is not None and image_url in rss_images:
+                image_result = rss_images[image_url]
+            else:
+                image_result = download_image(image_url)
             if not image_result:
                 image_url = None
 
     # Try scraping image from source URL if RSS image not found
     if not image_url and link:
-        scraped_image_url = scrape_image_from_url(link)
+        # Pages already attempted by prefetch_images are not fetched again,
+        # even if the batch deadline cut the scrape off
+        if scraped_images is not None and link in scraped_images:
+            scraped_image_url = scraped_images[link]
+        else:
+            scraped_image_url = scrape_image_from_url(link)
         if scraped_image_url:
             logger.info("using_scraped_image", url=scraped_image_url)
             image_result = download_image(scraped_image_url)
@@ -11,10 +11,12 @@ from rss_to_wp.feeds.parser import (
     get_entry_link,
     get_entry_title,
     parse_feed,
+    parse_feeds,
 )
 
 __all__ = [
     "parse_feed",
+    "parse_feeds",
     "get_entry_content",
     "get_entry_link",
     "get_entry_title",
@@ -3,22 +3,57 @@
 from __future__ import annotations
 
 import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from io import BytesIO
 from typing import Any, Optional
 
 import feedparser
 import requests
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 
-from rss_to_wp.utils import get_logger
+from rss_to_wp.storage import FeedCache
+from rss_to_wp.utils import get_logger, get_shared_session
 
 logger = get_logger("feeds.parser")
 
-
-def parse_feed(url: str) -> Optional[dict[str, Any]]:
+# Headers sent when downloading feeds (mirrors what feedparser sends itself)
+FEED_REQUEST_HEADERS = {
+    "User-Agent": feedparser.USER_AGENT,
+    "Accept": "application/atom+xml,application/rdf+xml,application/rss+xml,application/xml;q=0.9,text/xml;q=0.2,*/*;q=0.1",
+}
+
+# Page chrome removed before looking for article content
+UNWANTED_TAGS = ["script", "style", "nav", "header", "footer", "aside", "iframe", "noscript"]
+
+# Selectors for the main article body, in priority order
+# (athletics sites often use these)
+ARTICLE_CONTENT_SELECTORS = (
+    "article .article-body",
+    ".article-content",
+    ".story-body",
+    ".article__body",
+    "[itemprop='articleBody']",
+    ".node-content",
+    ".post-content",
+    ".entry-content",
+    "article",
+    ".content-body",
+    "main",
+    "#content",
+)
+
+WHITESPACE_RE = re.compile(r"\s+")
+
+
+def parse_feed(url: str, cache: Optional[FeedCache] = None) -> Optional[dict[str, Any]]:
     """Parse an RSS/Atom feed from URL.
 
     Args:
         url: URL of the RSS feed.
+        cache: Optional feed cache. When given, the feed is requested with
+            If-None-Match/If-Modified-Since and a 304 response is parsed
+            from the cached body instead of downloading it again.
 
     Returns:
         Parsed feed dictionary or None if parsing failed.
@@ -26,7 +61,43 @@ def parse_feed(url: str) -> Optional[dict[str, Any]]:
     logger.info("parsing_feed", url=url)
 
     try:
-        feed = feedparser.parse(url)
+        cached = cache.get(url) if cache else None
+
+        headers = dict(FEED_REQUEST_HEADERS)
+        if cached:
+            if cached["etag"]:
+                headers["If-None-Match"] = cached["etag"]
+            if cached["last_modified"]:
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        # Stream the response so the body is read straight off the socket in
+        # one piece rather than collected in chunks and joined by requests
+        with get_shared_session().get(
+            url, timeout=(10, 30), headers=headers, stream=True
+        ) as response:
+            response.raise_for_status()
+
+            if response.status_code == 304 and cached:
+                logger.info("feed_not_modified", url=url)
+                body = cached["body"]
+                response_headers = {"content-type": cached["content_type"] or ""}
+            else:
+                body = response.raw.read(decode_content=True)
+                if cache:
+                    cache.save(
+                        url,
+                        body,
+                        etag=response.headers.get("ETag"),
+                        last_modified=response.headers.get("Last-Modified"),
+                        content_type=response.headers.get("Content-Type"),
+                    )
+                response_headers = {k.lower(): v for k, v in response.headers.items()}
+
+        # feedparser needs the response headers for charset detection and
+        # Content-Location for resolving relative links
+        response_headers["content-location"] = response.url
+
+        feed = feedparser.parse(BytesIO(body), response_headers=response_headers)
 
         # Check for parsing errors
         if feed.bozo and feed.bozo_exception:
@@ -50,14 +121,44 @@ def parse_feed(url: str) -> Optional[dict[str, Any]]:
 
         return feed
 
+    except requests.RequestException as e:
+        logger.error("feed_fetch_error", url=url, error=str(e))
+        return None
     except Exception as e:
         logger.error("feed_parse_error", url=url, error=str(e))
         return None
 
 
+def parse_feeds(
+    urls: list[str],
+    max_workers: int = 8,
+    cache: Optional[FeedCache] = None,
+) -> dict[str, Optional[dict[str, Any]]]:
+    """Download and parse several RSS/Atom feeds concurrently.
+
+    Args:
+        urls: Feed URLs to parse. Duplicates are fetched once.
+        max_workers: Maximum number of feeds fetched at the same time.
+        cache: Optional feed cache for conditional requests (see parse_feed).
+
+    Returns:
+        Mapping of feed URL to parsed feed dictionary (None if parsing failed).
+    """
+    unique_urls = list(dict.fromkeys(urls))
+    if not unique_urls:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(unique_urls))) as executor:
+        return dict(zip(unique_urls, executor.map(partial(parse_feed, cache=cache), unique_urls)))
+
+
+@lru_cache(maxsize=1024)
 def scrape_article_content(url: str) -> Optional[str]:
     """Scrape full article content from a source URL.
 
+    Results (including failures) are cached per URL for the lifetime of
+    the process.
+
     Args:
         url: URL of the article to scrape.
 
@@ -70,7 +171,7 @@ def scrape_article_content(url: str) -> Optional[str]:
     logger.info("scraping_article", url=url)
     
     try:
-        response = requests.get(
+        response = get_shared_session().get(
             url,
             timeout=(10, 30),
             headers={
@@ -80,36 +181,19 @@ def scrape_article_content(url: str) -> Optional[str]:
         )
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.content, "html.parser")
+        tree = LexborHTMLParser(response.content)
         
-        # Remove unwanted elements
-        for element in soup(["script", "style", "nav", "header", "footer", "aside", "iframe", "noscript"]):
-            element.decompose()
+        # Remove unwanted elements (single pass over the tree)
+        tree.strip_tags(UNWANTED_TAGS, recursive=True)
         
         # Try to find the main article content using common selectors
         article_content = None
         
-        # Athletics sites often use these selectors
-        content_selectors = [
-            "article .article-body",
-            ".article-content",
-            ".story-body",
-            ".article__body",
-            "[itemprop='articleBody']",
-            ".node-content",
-            ".post-content",
-            ".entry-content",
-            "article",
-            ".content-body",
-            "main",
-            "#content",
-        ]
-        
-        for selector in content_selectors:
-            element = soup.select_one(selector)
+        for selector in ARTICLE_CONTENT_SELECTORS:
+            element = tree.css_first(selector)
             if element:
                 # Get text content
-                text = element.get_text(separator=" ", strip=True)
+                text = element.text(separator=" ", strip=True)
                 # Only use if it has substantial content
                 if len(text) > 200:
                     article_content = text
@@ -118,16 +202,16 @@ def scrape_article_content(url: str) -> Optional[str]:
         
         # If no article content found, try to get body text
         if not article_content:
-            body = soup.find("body")
+            body = tree.body
             if body:
-                text = body.get_text(separator=" ", strip=True)
+                text = body.text(separator=" ", strip=True)
                 if len(text) > 200:
                     article_content = text
                     logger.info("scraped_body_fallback", length=len(text))
         
         # Clean up whitespace
         if article_content:
-            article_content = re.sub(r'\s+', ' ', article_content)
+            article_content = WHITESPACE_RE.sub(" ", article_content)
             article_content = article_content.strip()
         
         return article_content
@@ -171,8 +255,10 @@ def get_entry_content(entry: dict[str, Any], scrape_if_short: bool = True) -> st
     
     # Check if RSS content is too short - if so, try to scrape the source
     # Strip HTML to get actual text length
-    clean_content = re.sub(r'<[^>]+>', '', rss_content)
-    clean_content = re.sub(r'\s+', ' ', clean_content).strip()
+    content_tree = LexborHTMLParser(rss_content)
+    content_tree.strip_tags(["script", "style"], recursive=True)
+    clean_content = content_tree.text(separator=" ", strip=True)
+    clean_content = WHITESPACE_RE.sub(" ", clean_content).strip()
     
     if scrape_if_short and len(clean_content) < 500:
         # Try to get the source URL and scrape
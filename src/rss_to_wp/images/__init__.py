@@ -1,15 +1,27 @@
 """Image handling module."""
 
-from rss_to_wp.images.downloader import download_image, extract_keywords, find_fallback_image
+from rss_to_wp.images.downloader import (
+    download_image,
+    download_images,
+    extract_keywords,
+    find_fallback_image,
+)
 from rss_to_wp.images.pexels import PexelsClient
-from rss_to_wp.images.rss_extractor import find_rss_image, is_valid_image_url, scrape_image_from_url
+from rss_to_wp.images.rss_extractor import (
+    find_rss_image,
+    is_valid_image_url,
+    scrape_image_from_url,
+    scrape_images_batch,
+)
 from rss_to_wp.images.unsplash import UnsplashClient
 
 __all__ = [
     "find_rss_image",
     "is_valid_image_url",
     "scrape_image_from_url",
+    "scrape_images_batch",
     "download_image",
+    "download_images",
     "extract_keywords",
     "find_fallback_image",
     "PexelsClient",
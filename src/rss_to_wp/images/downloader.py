@@ -2,20 +2,80 @@
 
 from __future__ import annotations
 
+import hashlib
 import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from io import BytesIO
 from typing import Optional
-from urllib.parse import urlparse
+from urllib.parse import unquote, urlparse
 
 import requests
 from PIL import Image
 
 from rss_to_wp.images.pexels import PexelsClient
+from rss_to_wp.images.rss_extractor import IMAGE_EXTENSIONS
 from rss_to_wp.images.unsplash import UnsplashClient
-from rss_to_wp.utils import get_logger
+from rss_to_wp.utils import get_logger, get_shared_session
 
 logger = get_logger("images.downloader")
 
+# Leading bytes of the common image formats
+IMAGE_SIGNATURES = (
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif"),
+    (b"BM", "image/bmp"),
+)
+
+# File extension to use for each image Content-Type
+CONTENT_TYPE_EXTENSIONS = {
+    "image/jpeg": ".jpg",
+    "image/png": ".png",
+    "image/gif": ".gif",
+    "image/webp": ".webp",
+    "image/bmp": ".bmp",
+}
+
+NON_WORD_RE = re.compile(r"[^\w\s]")
+
+# Common words that make poor image search keywords
+STOP_WORDS = frozenset({
+    "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for",
+    "of", "with", "by", "from", "as", "is", "was", "are", "were", "been",
+    "be", "have", "has", "had", "do", "does", "did", "will", "would",
+    "could", "should", "may", "might", "must", "shall", "can", "need",
+    "this", "that", "these", "those", "it", "its", "their", "our", "your",
+    "new", "announces", "released", "says", "reports", "today", "week",
+})
+
+# Sport-specific keywords mapping (earlier sports win when several match)
+SPORT_KEYWORDS = {
+    "basketball": ["basketball", "mbball", "wbball", "hoops"],
+    "baseball": ["baseball"],
+    "softball": ["softball"],
+    "football": ["football"],
+    "soccer": ["soccer", "msoc", "wsoc"],
+    "volleyball": ["volleyball", "vball"],
+    "tennis": ["tennis", "mten", "wten"],
+    "golf": ["golf", "mgolf", "wgolf"],
+    "track": ["track", "mtrack", "wtrack", "cross country", "mcross", "wcross"],
+    "swimming": ["swimming", "swim"],
+}
+
+# One alternation with a named group per sport, so a single scan of the
+# text finds every sport mentioned in it. Each branch is a lookahead so
+# matches don't consume text: overlapping keywords ("swimcross") are all seen.
+SPORT_KEYWORDS_RE = re.compile(
+    "|".join(
+        f"(?=(?P<{sport}>{'|'.join(map(re.escape, keywords))}))"
+        for sport, keywords in SPORT_KEYWORDS.items()
+    )
+)
+
+# Stock photos found per (query, pexels_key, unsplash_key) during this run
+_stock_photo_cache: dict[tuple[str, Optional[str], Optional[str]], dict] = {}
+
 
 def download_image(
     url: str,
@@ -35,7 +95,7 @@ def download_image(
     logger.info("downloading_image", url=url)
 
     try:
-        response = requests.get(
+        response = get_shared_session().get(
             url,
             timeout=timeout,
             headers={"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"},
@@ -44,21 +104,43 @@ def download_image(
         response.raise_for_status()
 
         # Check content length
+        max_bytes = int(max_size_mb * 1024 * 1024)
         content_length = response.headers.get("Content-Length")
-        if content_length and int(content_length) > max_size_mb * 1024 * 1024:
+        if content_length and int(content_length) > max_bytes:
             logger.warning("image_too_large", url=url, size_mb=int(content_length) / (1024 * 1024))
+            response.close()
             return None
 
-        # Read content
-        content = response.content
-
-        # Validate it's actually an image
-        try:
-            img = Image.open(BytesIO(content))
-            img.verify()
-        except Exception as e:
-            logger.warning("invalid_image", url=url, error=str(e))
-            return None
+        # Read content in chunks, bailing out as soon as the limit is exceeded
+        # (servers don't always send Content-Length). When the body isn't
+        # content-encoded, Content-Length is its exact size, so the buffer is
+        # allocated once and filled in place instead of grown chunk by chunk.
+        expected_size = 0
+        if content_length and response.headers.get("Content-Encoding", "identity") == "identity":
+            expected_size = int(content_length)
+
+        buffer = bytearray(expected_size)
+        size = 0
+        for chunk in response.iter_content(65536):
+            end = size + len(chunk)
+            if end > max_bytes:
+                logger.warning("image_too_large", url=url, size_mb=end / (1024 * 1024))
+                response.close()
+                return None
+            buffer[size:end] = chunk
+            size = end
+        del buffer[size:]
+        content = bytes(buffer)
+
+        # Validate it's actually an image - the magic-byte sniff handles the
+        # common formats, PIL is only needed for anything else
+        if not _sniff_image_type(content):
+            try:
+                img = Image.open(BytesIO(content))
+                img.verify()
+            except Exception as e:
+                logger.warning("invalid_image", url=url, error=str(e))
+                return None
 
         # Determine filename and type
         content_type = response.headers.get("Content-Type", "image/jpeg")
@@ -81,6 +163,56 @@ def download_image(
         return None
 
 
+def _sniff_image_type(content: bytes) -> Optional[str]:
+    """Identify common image formats from their magic bytes.
+
+    Args:
+        content: Image bytes (only the first 12 bytes are inspected).
+
+    Returns:
+        MIME type of the image, or None if the format wasn't recognized.
+    """
+    header = content[:12]
+    for signature, mime_type in IMAGE_SIGNATURES:
+        if header.startswith(signature):
+            return mime_type
+    if header[:4] == b"RIFF" and header[8:12] == b"WEBP":
+        return "image/webp"
+    return None
+
+
+def download_images(
+    urls: list[str],
+    max_size_mb: float = 5.0,
+    timeout: tuple[int, int] = (10, 30),
+    max_workers: int = 8,
+) -> list[Optional[tuple[bytes, str, str]]]:
+    """Download several images concurrently.
+
+    Args:
+        urls: Image URLs to download.
+        max_size_mb: Maximum file size in MB per image.
+        timeout: Request timeout (connect, read).
+        max_workers: Maximum number of concurrent downloads.
+
+    Returns:
+        List of download_image() results, in the same order as urls.
+    """
+    results: list[Optional[tuple[bytes, str, str]]] = [None] * len(urls)
+    if not urls:
+        return results
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as executor:
+        futures = {
+            executor.submit(download_image, url, max_size_mb, timeout): index
+            for index, url in enumerate(urls)
+        }
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+
+    return results
+
+
 def _extract_filename(url: str, content_type: str) -> str:
     """Extract or generate a filename from URL or content type.
 
@@ -91,8 +223,6 @@ def _extract_filename(url: str, content_type: str) -> str:
     Returns:
         Filename string.
     """
-    valid_exts = {".jpg", ".jpeg", ".png", ".gif", ".webp", ".bmp"}
-    
     parsed = urlparse(url)
     
     # 1. Try to get from URL path if it has a valid image extension
@@ -101,39 +231,33 @@ def _extract_filename(url: str, content_type: str) -> str:
         filename = path.split("/")[-1].split("?")[0]
         if filename and "." in filename:
             ext = "." + filename.rsplit(".", 1)[-1].lower()
-            if ext in valid_exts:
+            if ext in IMAGE_EXTENSIONS:
                 return filename
 
     # 2. Try to find extension in query string (e.g., image_path=...jpg)
     if parsed.query:
         # Look for common patterns like .jpg in the query
         for part in parsed.query.split("&"):
-            if "=" in part:
-                value = part.split("=", 1)[1]
-                # If value is a path/url, get the end
-                if "/" in value:
-                    value = value.split("/")[-1]
-                
-                if "." in value:
-                    ext = "." + value.rsplit(".", 1)[-1].lower()
-                    if ext in valid_exts:
-                        return value
+            if "=" not in part:
+                continue
+            # unquote(), not unquote_plus(): "+" in a path is a literal plus
+            value = unquote(part.split("=", 1)[1])
+            # If value is a path/url, get the end
+            if "/" in value:
+                value = value.split("/")[-1]
+
+            if "." in value:
+                ext = "." + value.rsplit(".", 1)[-1].lower()
+                if ext in IMAGE_EXTENSIONS:
+                    return value
 
     # 3. Generate based on content type
-    ext_map = {
-        "image/jpeg": ".jpg",
-        "image/png": ".png",
-        "image/gif": ".gif",
-        "image/webp": ".webp",
-        "image/bmp": ".bmp",
-    }
     # Clean content type (remove charset etc)
     content_type = content_type.split(";")[0].strip().lower()
-    ext = ext_map.get(content_type, ".jpg")
+    ext = CONTENT_TYPE_EXTENSIONS.get(content_type, ".jpg")
 
     # Use a hash of the URL to ensure uniqueness but consistency
-    import hashlib
-    url_hash = hashlib.md5(url.encode()).hexdigest()[:10]
+    url_hash = hashlib.blake2b(url.encode(), digest_size=5).hexdigest()
     return f"featured-image-{url_hash}{ext}"
 
 
@@ -148,34 +272,26 @@ def extract_keywords(text: str, max_words: int = 5) -> str:
     Returns:
         Cleaned keyword string.
     """
-    # Remove common stop words
-    stop_words = {
-        "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for",
-        "of", "with", "by", "from", "as", "is", "was", "are", "were", "been",
-        "be", "have", "has", "had", "do", "does", "did", "will", "would",
-        "could", "should", "may", "might", "must", "shall", "can", "need",
-        "this", "that", "these", "those", "it", "its", "their", "our", "your",
-        "new", "announces", "released", "says", "reports", "today", "week",
-    }
-
     # Clean text
-    text = re.sub(r"[^\w\s]", " ", text.lower())
-    words = text.split()
+    text = NON_WORD_RE.sub(" ", text.lower())
+
+    # Filter stop words and short words, keeping the first N unique words
+    keywords = dict.fromkeys(w for w in text.split() if len(w) > 2 and w not in STOP_WORDS)
 
-    # Filter stop words and short words
-    keywords = [w for w in words if w not in stop_words and len(w) > 2]
+    return " ".join(list(keywords)[:max_words])
 
-    # Return top N unique words
-    seen = set()
-    unique_keywords = []
-    for w in keywords:
-        if w not in seen:
-            seen.add(w)
-            unique_keywords.append(w)
-        if len(unique_keywords) >= max_words:
-            break
 
-    return " ".join(unique_keywords)
+def _detect_sport(text: str) -> Optional[str]:
+    """Detect which sport a piece of text is about.
+
+    Args:
+        text: Text to scan (title, feed name, etc.).
+
+    Returns:
+        Sport name from SPORT_KEYWORDS, or None if no sport was mentioned.
+    """
+    mentioned = {match.lastgroup for match in SPORT_KEYWORDS_RE.finditer(text.lower())}
+    return next((sport for sport in SPORT_KEYWORDS if sport in mentioned), None)
 
 
 def find_fallback_image(
@@ -202,33 +318,23 @@ def find_fallback_image(
         logger.warning("no_fallback_providers_configured")
         return None
 
+    query = _fallback_query(title, feed_name)
+    return _search_stock_photo(query, pexels_key=pexels_key, unsplash_key=unsplash_key)
+
+
+def _fallback_query(title: str, feed_name: str) -> str:
+    """Build the stock photo search query for an article.
+
+    Args:
+        title: Article title for keyword extraction.
+        feed_name: Feed name for additional context.
+
+    Returns:
+        Search query string.
+    """
     # Detect sport from title and feed name for better search
-    combined_text = f"{title} {feed_name}".lower()
-    
-    # Sport-specific keywords mapping
-    sport_queries = {
-        "basketball": ["basketball", "mbball", "wbball", "hoops"],
-        "baseball": ["baseball"],
-        "softball": ["softball"],
-        "football": ["football"],
-        "soccer": ["soccer", "msoc", "wsoc"],
-        "volleyball": ["volleyball", "vball"],
-        "tennis": ["tennis", "mten", "wten"],
-        "golf": ["golf", "mgolf", "wgolf"],
-        "track": ["track", "mtrack", "wtrack", "cross country", "mcross", "wcross"],
-        "swimming": ["swimming", "swim"],
-    }
-    
-    # Find matching sport
-    detected_sport = None
-    for sport, keywords in sport_queries.items():
-        for keyword in keywords:
-            if keyword in combined_text:
-                detected_sport = sport
-                break
-        if detected_sport:
-            break
-    
+    detected_sport = _detect_sport(f"{title} {feed_name}")
+
     # Build search query based on detected sport
     if detected_sport:
         # Use sport-specific search for cleaner results
@@ -241,26 +347,58 @@ def find_fallback_image(
             query = "college sports athletics"
         logger.info("fallback_image_search", query=query)
 
+    return query
+
+
+def _search_stock_photo(
+    query: str,
+    pexels_key: Optional[str] = None,
+    unsplash_key: Optional[str] = None,
+) -> Optional[dict]:
+    """Search the stock photo providers, Pexels first, then Unsplash.
+
+    Found photos are cached per query, so articles that produce the same
+    query during a run don't repeat the search. Misses are not cached, so a
+    transient provider failure is retried for the next article.
+
+    Args:
+        query: Search query string.
+        pexels_key: Pexels API key (optional).
+        unsplash_key: Unsplash access key (optional).
+
+    Returns:
+        Dictionary with url, photographer, source, alt_text, or None.
+    """
+    cache_key = (query, pexels_key, unsplash_key)
+    cached = _stock_photo_cache.get(cache_key)
+    if cached:
+        if cached["source"] == "Unsplash" and unsplash_key:
+            # Unsplash requires a download event for every use of a photo
+            UnsplashClient(unsplash_key).track_download(cached.get("download_location"))
+        logger.info("fallback_image_cache_hit", query=query, source=cached["source"])
+        return cached
+
+    result = None
+
     # Try Pexels first (more generous rate limit)
     if pexels_key:
         try:
             pexels = PexelsClient(pexels_key)
             result = pexels.search(query)
-            if result:
-                return result
         except Exception as e:
             logger.warning("pexels_fallback_error", error=str(e))
 
     # Try Unsplash
-    if unsplash_key:
+    if not result and unsplash_key:
         try:
             unsplash = UnsplashClient(unsplash_key)
             result = unsplash.search(query)
-            if result:
-                return result
         except Exception as e:
             logger.warning("unsplash_fallback_error", error=str(e))
 
-    logger.warning("no_fallback_image_found", query=query)
-    return None
+    if not result:
+        logger.warning("no_fallback_image_found", query=query)
+        return None
 
+    _stock_photo_cache[cache_key] = result
+    return result
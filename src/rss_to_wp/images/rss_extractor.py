@@ -2,31 +2,34 @@
 
 from __future__ import annotations
 
+import html as html_lib
 import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from typing import Any, Optional
-from urllib.parse import urljoin, urlparse
+from urllib.parse import ParseResult, urljoin, urlparse
 
 import requests
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser, LexborNode
 
-from rss_to_wp.utils import get_logger
+from rss_to_wp.utils import get_logger, get_shared_session
 
 logger = get_logger("images.rss_extractor")
 
 # Valid image extensions
-IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".gif", ".webp", ".bmp"}
+IMAGE_EXTENSIONS = frozenset({".jpg", ".jpeg", ".png", ".gif", ".webp", ".bmp"})
 
 # Valid image MIME types
-IMAGE_MIME_TYPES = {
+IMAGE_MIME_TYPES = frozenset({
     "image/jpeg",
     "image/png",
     "image/gif",
     "image/webp",
     "image/bmp",
-}
+})
 
 # BLOCKED domains - never use images from these (ads, adult, tracking, etc.)
-BLOCKED_IMAGE_DOMAINS = {
+BLOCKED_IMAGE_DOMAINS = frozenset({
     # Ad networks
     "doubleclick.net",
     "googlesyndication.com",
@@ -62,8 +65,252 @@ BLOCKED_IMAGE_DOMAINS = {
     "shutterstock",
     "istockphoto",
     "gettyimages",
+})
+
+# Placeholder/tracking image patterns skipped when picking an <img> from HTML
+IMAGE_SKIP_PATTERNS = (
+    "pixel",
+    "spacer",
+    "blank",
+    "1x1",
+    "tracking",
+    "beacon",
+    "analytics",
+    "gravatar",
+    "avatar",
+)
+
+# Hosts whose image URLs are trusted even without a file extension
+# (image CDNs and athletics sites)
+KNOWN_IMAGE_HOSTS = (
+    "pexels.com",
+    "unsplash.com",
+    "cloudinary.com",
+    "imgix.net",
+    "wp.com",
+    "wordpress.com",
+    "flickr.com",
+    "staticflickr.com",
+    "sidearm",  # Sidearm Sports CDN used by athletics sites
+    "prestosports",  # Presto Sports CDN
+    "bmcusports.com",  # Blue Mountain Christian athletics
+    "careyathletics.com",  # William Carey athletics
+    "nwccrangers.com",  # Northwest Mississippi CC athletics
+    "coahomasports.com",  # Coahoma CC athletics
+    "gostatesmen.com",  # Delta State athletics
+    "mvsusports.com",  # Mississippi Valley State athletics
+    "alcornsports.com",  # Alcorn State athletics
+    "gojsutigers.com",  # Jackson State athletics
+    "southernmiss.com",  # Southern Miss athletics
+    "hailstate.com",  # Mississippi State athletics
+    "olemisssports.com",  # Ole Miss athletics
+    "gochoctaws.com",  # Mississippi College athletics
+    "blazers.belhaven.edu",  # Belhaven University athletics
+    "gomajors.com",  # Millsaps College athletics
+    "owlsathletics.com",  # Mississippi University for Women athletics
+    "sports.hindscc.edu",  # Hinds Community College athletics
+    "jcbobcats.com",  # Jones College athletics
+    "southwestbearathletics.com",  # Southwest Mississippi Community College athletics
+)
+
+# Image CDN patterns trusted as "same domain" for specific athletics sites
+TRUSTED_IMAGE_CDNS = {
+    "careyathletics.com": ("sidearm", "prestosports"),  # Sidearm/Presto Sports CDNs
 }
 
+# Everything scrape_image_from_url looks at, gathered with a single query
+IMAGE_CANDIDATES_QUERY = (
+    'picture source, img, .wp-post-image, meta[property="og:image"], meta[name="twitter:image"]'
+)
+
+# Content types scraped as article pages
+HTML_CONTENT_TYPES = frozenset({"text/html", "application/xhtml+xml"})
+
+# Maximum number of bytes read from an article page when scraping images
+MAX_PAGE_BYTES = 512 * 1024
+
+# Containers that qualify a <picture><source> as the article image, in
+# priority order ("" matches any picture)
+PICTURE_SOURCE_CONTAINERS = (
+    "article",
+    ".article-content",
+    ".story-content",
+    ".hero-image",
+    ".featured-image",
+    "",
+)
+
+# Hero image candidates in priority order, as (container, element) markers:
+# ("article", "img") is "article img", ("", ".wp-post-image") is ".wp-post-image"
+HERO_IMAGE_SELECTORS = (
+    ("article", "img"),
+    (".article-content", "img"),
+    (".story-content", "img"),
+    (".hero-image", "img"),
+    (".featured-image", "img"),
+    (".article-image", "img"),
+    (".story-image", "img"),
+    (".post-thumbnail", "img"),
+    ("", ".wp-post-image"),
+    ("figure", "img"),
+)
+
+# Blocked patterns that are a single hostname label ("pixel", "analytics",
+# and "ads" from "ads.")
+BLOCKED_IMAGE_LABELS = frozenset(
+    d.strip(".") for d in BLOCKED_IMAGE_DOMAINS if "." not in d.strip(".")
+)
+
+# Blocked patterns that are full domains ("doubleclick.net")
+BLOCKED_IMAGE_HOST_SUFFIXES = tuple(sorted(d for d in BLOCKED_IMAGE_DOMAINS if "." in d.strip(".")))
+
+# Single-pass matchers for the substring lists above
+KNOWN_IMAGE_HOSTS_RE = re.compile("|".join(map(re.escape, KNOWN_IMAGE_HOSTS)))
+IMAGE_EXTENSION_SUFFIXES = tuple(IMAGE_EXTENSIONS)
+IMAGE_EXTENSION_RE = re.compile("|".join(map(re.escape, IMAGE_EXTENSIONS)))
+
+# One srcset candidate: URL (trailing commas stripped), optional width or
+# density descriptor, then anything up to the separating comma
+SRCSET_CANDIDATE_RE = re.compile(r"(\S*[^\s,])(?:,+|(?:\s+(\d*\.?\d+)[wx])?[^,]*,?)")
+
+# Raw-bytes matchers for the meta image fast path in scrape_image_from_url
+PICTURE_TAG_RE = re.compile(rb"<picture\b", re.IGNORECASE)
+OG_IMAGE_TAG_RE = re.compile(rb"<(?i:meta)\s[^>]*(?<=[\s\"'])(?i:property)\s*=\s*[\"']og:image[\"'][^>]*>")
+TWITTER_IMAGE_TAG_RE = re.compile(rb"<(?i:meta)\s[^>]*(?<=[\s\"'])(?i:name)\s*=\s*[\"']twitter:image[\"'][^>]*>")
+HIDDEN_MARKUP_DELIMITERS = ((b"<!--", b"-->"), (b"<script", b"</script"))
+META_CONTENT_RE = re.compile(rb"(?<=[\s\"'])content\s*=\s*(?:\"([^\"]*)\"|'([^']*)')", re.IGNORECASE)
+
+
+@lru_cache(maxsize=1024)
+def _cached_urlparse(url: str) -> ParseResult:
+    """urlparse() memoized per URL (the same URLs are checked repeatedly)."""
+    return urlparse(url)
+
+
+@lru_cache(maxsize=1024)
+def _url_features(url: str) -> tuple[str, str, str]:
+    """Get the lowercased parts of a URL used by the validation checks.
+
+    Args:
+        url: URL to decompose.
+
+    Returns:
+        Tuple of (netloc without "www.", path, query), all lowercased.
+    """
+    parsed = _cached_urlparse(url)
+    return (
+        parsed.netloc.lower().removeprefix("www."),
+        parsed.path.lower(),
+        parsed.query.lower(),
+    )
+
+
+def _is_blocked_host(url: str) -> bool:
+    """Check if a URL's host is a blocked ad/tracking domain.
+
+    Unlike is_image_domain_blocked(), only the host is considered, so
+    article paths that mention "sponsor" or "banner" are not rejected.
+    """
+    try:
+        host = _url_features(url)[0].partition(":")[0]
+    except ValueError:
+        return False
+    # The last label is the TLD (".ad" is Andorra, not an ad host)
+    return bool(BLOCKED_IMAGE_LABELS.intersection(host.split(".")[:-1])) or host.endswith(
+        BLOCKED_IMAGE_HOST_SUFFIXES
+    )
+
+
+def _is_direct_image_url(url: str) -> bool:
+    """Check if a URL's path ends in an image file extension.
+
+    Stricter than is_valid_image_url(), which also trusts extensionless
+    URLs on known hosts - those hosts serve article pages too.
+    """
+    try:
+        return _url_features(url)[1].endswith(IMAGE_EXTENSION_SUFFIXES)
+    except ValueError:
+        return False
+
+
+def _best_srcset_candidate(srcset: str) -> Optional[str]:
+    """Get the URL with the largest descriptor from a srcset attribute.
+
+    Candidates without a descriptor count as 1x; ties keep the first.
+
+    Args:
+        srcset: Value of a srcset attribute.
+
+    Returns:
+        Image URL or None if the srcset has no candidates.
+    """
+    best_url = None
+    best_size = 0.0
+    for match in SRCSET_CANDIDATE_RE.finditer(srcset):
+        size = float(match.group(2)) if match.group(2) else 1.0
+        if best_url is None or size > best_size:
+            best_url, best_size = match.group(1), size
+    return best_url
+
+
+def _find_meta_image_fast(html: bytes) -> Optional[tuple[str, str]]:
+    """Find the og:image or twitter:image URL in a page without parsing it.
+
+    Only answers when the result is certain to match the full parse in
+    scrape_image_from_url: pages with <picture> sources (which outrank
+    meta tags), with meta tags the regexes can't read cleanly, or where
+    the match may sit inside a comment or <script>, return None so the
+    caller falls back to the DOM.
+
+    Args:
+        html: Raw page bytes.
+
+    Returns:
+        Tuple of ("og" or "twitter", image URL), or None.
+    """
+    if PICTURE_TAG_RE.search(html):
+        return None
+
+    for source, tag_re, marker in (
+        ("og", OG_IMAGE_TAG_RE, b"og:image"),
+        ("twitter", TWITTER_IMAGE_TAG_RE, b"twitter:image"),
+    ):
+        tag = tag_re.search(html)
+        if not tag:
+            if marker in html:
+                # Present in a form the regex doesn't cover
+                return None
+            continue
+
+        # The DOM ignores markup inside comments and scripts
+        before = html[: tag.start()].lower()
+        for opener, closer in HIDDEN_MARKUP_DELIMITERS:
+            start = before.rfind(opener)
+            if start != -1 and before.find(closer, start) == -1:
+                return None
+
+        content = META_CONTENT_RE.search(tag.group(0))
+        if not content:
+            return None
+        raw_url = content.group(1) if content.group(1) is not None else content.group(2)
+        if not raw_url or not raw_url.isascii():
+            return None
+
+        image_url = html_lib.unescape(raw_url.decode("ascii"))
+        if is_valid_image_url(image_url) and not is_image_domain_blocked(image_url):
+            return source, image_url
+        return None
+
+    return None
+
+
+def _element_markers(node: LexborNode) -> set[str]:
+    """Get the tag name and ".class" markers of an element."""
+    markers = {node.tag}
+    for class_name in (node.attributes.get("class") or "").split():
+        markers.add("." + class_name)
+    return markers
+
 
 def is_image_domain_blocked(url: str) -> bool:
     """Check if image URL is from a blocked domain.
@@ -102,15 +349,9 @@ def is_same_domain(source_url: str, image_url: str) -> bool:
         return False
         
     try:
-        source_parsed = urlparse(source_url)
-        image_parsed = urlparse(image_url)
-        
-        source_domain = source_parsed.netloc.lower()
-        image_domain = image_parsed.netloc.lower()
-        
-        # Remove www. prefix for comparison
-        source_domain = source_domain.replace("www.", "")
-        image_domain = image_domain.replace("www.", "")
+        # Domains without the www. prefix
+        source_domain = _url_features(source_url)[0]
+        image_domain = _url_features(image_url)[0]
         
         # Exact match
         if source_domain == image_domain:
@@ -120,16 +361,13 @@ def is_same_domain(source_url: str, image_url: str) -> bool:
         if image_domain.endswith("." + source_domain):
             return True
         
-        # Allow CDN patterns for known athletics sites
-        trusted_cdn_patterns = [
-            ("careyathletics.com", "sidearm"),  # Sidearm Sports CDN
-            ("careyathletics.com", "sidearmsports"),
-            ("careyathletics.com", "prestosports"),
-        ]
-        
-        for site, cdn_pattern in trusted_cdn_patterns:
-            if site in source_domain and cdn_pattern in image_domain:
-                return True
+        # Allow CDN patterns for known athletics sites (and their subdomains)
+        site = source_domain
+        while site:
+            cdn_patterns = TRUSTED_IMAGE_CDNS.get(site)
+            if cdn_patterns:
+                return any(pattern in image_domain for pattern in cdn_patterns)
+            site = site.partition(".")[2]
         
         return False
         
@@ -137,8 +375,12 @@ def is_same_domain(source_url: str, image_url: str) -> bool:
         return False
 
 
+@lru_cache(maxsize=256)
 def scrape_image_from_url(url: str) -> Optional[str]:
     """Scrape the main image from a source article URL.
+
+    Results (including failures) are cached per URL for the lifetime of
+    the process.
     
     PRIORITY ORDER:
     1. <picture><source srcset> tags (responsive images - used by athletics sites)
@@ -154,55 +396,123 @@ def scrape_image_from_url(url: str) -> Optional[str]:
     """
     if not url:
         return None
+
+    # Don't fetch pages from ad/tracking hosts at all
+    if _is_blocked_host(url):
+        logger.debug("scrape_skipped_blocked_host", url=url)
+        return None
+
+    # Links that already point at an image file need no fetch or parse
+    if _is_direct_image_url(url) and not is_image_domain_blocked(url):
+        logger.info("source_url_is_image", url=url)
+        return url
     
     logger.info("scraping_image_from_url", url=url)
     
     try:
-        response = requests.get(
+        # Stream the page and stop at MAX_PAGE_BYTES: the images we look for
+        # are near the top, trailing scripts and comments are not needed
+        with get_shared_session().get(
             url,
             timeout=(10, 30),
             headers={
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
                 "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            }
-        )
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.content, "html.parser")
+            },
+            stream=True,
+        ) as response:
+            response.raise_for_status()
+
+            # Links to images or other non-HTML files (PDFs, video) have no
+            # page to parse; a missing Content-Type is treated as HTML
+            content_type = response.headers.get("Content-Type", "").split(";", 1)[0].strip().lower()
+            if content_type.startswith("image/"):
+                if is_image_domain_blocked(url):
+                    return None
+                logger.info("source_url_is_image", url=url, content_type=content_type)
+                return url
+            if content_type and content_type not in HTML_CONTENT_TYPES:
+                logger.debug("source_url_not_html", url=url, content_type=content_type)
+                return None
+
+            html = bytearray()
+            for chunk in response.iter_content(chunk_size=65536):
+                html += chunk
+                if len(html) >= MAX_PAGE_BYTES:
+                    logger.debug("page_truncated", url=url, max_bytes=MAX_PAGE_BYTES)
+                    break
+
+        html = bytes(html)
+
+        # Most pages are settled by og:image/twitter:image; find those with
+        # regexes and only build the DOM when the fast path can't decide
+        meta_image = _find_meta_image_fast(html)
+        if meta_image:
+            source, image_url = meta_image
+            logger.info(f"found_{source}_image", url=image_url)
+            return image_url
+
+        tree = LexborHTMLParser(html)
         
+        # Collect every <picture><source>, image meta tag and candidate <img>
+        # in one query, then rank each by the containers it sits in (one
+        # ancestor walk per node instead of a full-tree query per selector)
+        picture_sources: dict[int, list[LexborNode]] = {}  # priority -> sources, in document order
+        hero_images: dict[int, LexborNode] = {}  # priority -> first matching element
+        og_image = twitter_image = None
+        for node in tree.css(IMAGE_CANDIDATES_QUERY):
+            if node.tag == "meta":
+                if og_image is None and node.attributes.get("property") == "og:image":
+                    og_image = node
+                if twitter_image is None and node.attributes.get("name") == "twitter:image":
+                    twitter_image = node
+                continue
+
+            ancestor_markers = set()
+            parent = node.parent
+            while parent is not None:
+                ancestor_markers |= _element_markers(parent)
+                parent = parent.parent
+
+            if node.tag == "source":
+                for priority, container in enumerate(PICTURE_SOURCE_CONTAINERS):
+                    if not container or container in ancestor_markers:
+                        picture_sources.setdefault(priority, []).append(node)
+                continue
+
+            own_markers = _element_markers(node)
+            for priority, (container, element) in enumerate(HERO_IMAGE_SELECTORS):
+                if priority in hero_images or element not in own_markers:
+                    continue
+                if not container or container in ancestor_markers:
+                    hero_images[priority] = node
+
         # 1. Check <picture><source srcset> tags (HIGHEST PRIORITY)
         # Athletics sites like careyathletics.com use responsive images
         # Example: <source media="(min-width:768px)" srcset="/images/2026/1/15/DSC_3570.jpg?width=647...">
-        picture_selectors = [
-            "article picture source",
-            ".article-content picture source",
-            ".story-content picture source", 
-            ".hero-image picture source",
-            ".featured-image picture source",
-            "picture source",
-        ]
-        
-        for selector in picture_selectors:
-            sources = soup.select(selector)
-            for source in sources:
-                srcset = source.get("srcset")
+        for priority in sorted(picture_sources):
+            for source in picture_sources[priority]:
+                srcset = source.attributes.get("srcset")
                 if srcset:
-                    # Parse srcset - take the first URL (before any space/descriptor)
+                    # Take the largest candidate rather than the first (often a thumbnail)
                     # Example: "/images/2026/1/15/DSC_3570.jpg?width=647&quality=80 1x, /images/... 2x"
-                    first_src = srcset.split(",")[0].strip().split()[0]
-                    if first_src:
+                    best_src = _best_srcset_candidate(srcset)
+                    if best_src:
                         # Resolve relative URLs
-                        if not first_src.startswith(("http://", "https://")):
-                            first_src = urljoin(url, first_src)
+                        if not best_src.startswith(("http://", "https://")):
+                            best_src = urljoin(url, best_src)
                         
-                        if is_valid_image_url(first_src) and not is_image_domain_blocked(first_src):
-                            logger.info("found_srcset_image", url=first_src, selector=selector)
-                            return first_src
+                        if is_valid_image_url(best_src) and not is_image_domain_blocked(best_src):
+                            logger.info(
+                                "found_srcset_image",
+                                url=best_src,
+                                container=PICTURE_SOURCE_CONTAINERS[priority] or "picture",
+                            )
+                            return best_src
         
         # 2. Check og:image meta tag (TRUSTED - from source page meta)
-        og_image = soup.find("meta", property="og:image")
-        if og_image and og_image.get("content"):
-            image_url = og_image["content"]
+        if og_image and og_image.attributes.get("content"):
+            image_url = og_image.attributes["content"]
             if is_valid_image_url(image_url) and not is_image_domain_blocked(image_url):
                 logger.info("found_og_image", url=image_url)
                 return image_url
@@ -210,41 +520,27 @@ def scrape_image_from_url(url: str) -> Optional[str]:
                 logger.debug("og_image_rejected", image_url=image_url, reason="blocked or invalid")
         
         # 3. Check twitter:image meta tag (TRUSTED - from source page meta)
-        twitter_image = soup.find("meta", attrs={"name": "twitter:image"})
-        if twitter_image and twitter_image.get("content"):
-            image_url = twitter_image["content"]
+        if twitter_image and twitter_image.attributes.get("content"):
+            image_url = twitter_image.attributes["content"]
             if is_valid_image_url(image_url) and not is_image_domain_blocked(image_url):
                 logger.info("found_twitter_image", url=image_url)
                 return image_url
         
         # 4. Look for featured/hero <img> tags
         # These require same-domain validation (more likely to be ads)
-        hero_selectors = [
-            "article img",
-            ".article-content img",
-            ".story-content img",
-            ".hero-image img",
-            ".featured-image img",
-            ".article-image img",
-            ".story-image img",
-            ".post-thumbnail img",
-            ".wp-post-image",
-            "figure img",
-        ]
-        
-        for selector in hero_selectors:
-            img = soup.select_one(selector)
-            if img:
-                src = img.get("src") or img.get("data-src")
-                if src:
-                    # Resolve relative URLs
-                    if not src.startswith(("http://", "https://")):
-                        src = urljoin(url, src)
-                    
-                    # Strict validation for scraped img tags (same domain + not blocked)
-                    if is_valid_image_url(src) and is_same_domain(url, src) and not is_image_domain_blocked(src):
-                        logger.info("found_hero_image", url=src, selector=selector)
-                        return src
+        for priority in sorted(hero_images):
+            img = hero_images[priority]
+            src = img.attributes.get("src") or img.attributes.get("data-src")
+            if src:
+                # Resolve relative URLs
+                if not src.startswith(("http://", "https://")):
+                    src = urljoin(url, src)
+                
+                # Strict validation for scraped img tags (same domain + not blocked)
+                if is_valid_image_url(src) and is_same_domain(url, src) and not is_image_domain_blocked(src):
+                    container, element = HERO_IMAGE_SELECTORS[priority]
+                    logger.info("found_hero_image", url=src, selector=f"{container} {element}".strip())
+                    return src
         
         logger.debug("no_safe_image_found_in_source", url=url)
         return None
@@ -256,6 +552,47 @@ def scrape_image_from_url(url: str) -> Optional[str]:
         logger.warning("image_scrape_error", url=url, error=str(e))
         return None
 
+
+def scrape_images_batch(
+    urls: list[str],
+    max_workers: int = 8,
+    timeout: float = 30.0,
+) -> dict[str, Optional[str]]:
+    """Scrape the main image from several article URLs concurrently.
+
+    Results also land in scrape_image_from_url's cache, so later
+    single-URL calls for the same articles are free.
+
+    Args:
+        urls: Article URLs to scrape. Duplicates are scraped once.
+        max_workers: Maximum number of pages fetched at the same time.
+        timeout: Overall deadline in seconds for the whole batch.
+
+    Returns:
+        Mapping of article URL to image URL (None if none found or the
+        deadline passed first).
+    """
+    unique_urls = list(dict.fromkeys(url for url in urls if url))
+    results: dict[str, Optional[str]] = dict.fromkeys(unique_urls)
+    if not unique_urls:
+        return results
+
+    executor = ThreadPoolExecutor(max_workers=min(max_workers, len(unique_urls)))
+    futures = {executor.submit(scrape_image_from_url, url): url for url in unique_urls}
+    try:
+        for future in as_completed(futures, timeout=timeout):
+            results[futures[future]] = future.result()
+    except TimeoutError:
+        logger.warning(
+            "image_scrape_batch_timeout",
+            pending=sum(not future.done() for future in futures),
+        )
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    return results
+
+
 def is_valid_image_url(url: str) -> bool:
     """Check if URL appears to be a valid image.
 
@@ -269,25 +606,25 @@ def is_valid_image_url(url: str) -> bool:
         return False
 
     try:
-        parsed = urlparse(url)
+        parsed = _cached_urlparse(url)
         if not parsed.scheme or not parsed.netloc:
             return False
 
+        netloc_lower, path_lower, query_lower = _url_features(url)
+
         # Check extension - handle query strings by looking at path only
         # Example: /images/DSC_3570.jpg?width=647 -> check .jpg
-        path_lower = parsed.path.lower()
         
         # Split off any trailing slashes and check file extension
         path_parts = path_lower.rstrip('/').split('/')
         if path_parts:
             filename = path_parts[-1]
-            for ext in IMAGE_EXTENSIONS:
-                if ext in filename:  # Use 'in' to catch .jpg?... patterns
-                    return True
+            # Search (not endswith) to catch .jpg?... and .jpg:large patterns
+            if IMAGE_EXTENSION_RE.search(filename):
+                return True
         
         # Check query params for format indicators (used by image CDNs)
         # Example: ?format=jpg or ?type=jpeg or ?image_path=...jpg
-        query_lower = parsed.query.lower()
         if "format=jpg" in query_lower or "format=jpeg" in query_lower or "format=png" in query_lower:
             return True
         if "type=jpg" in query_lower or "type=jpeg" in query_lower or "type=png" in query_lower:
@@ -298,40 +635,8 @@ def is_valid_image_url(url: str) -> bool:
 
         # Some CDN URLs don't have extensions but are still valid
         # Allow URLs from known image CDNs and athletics sites
-        known_image_hosts = [
-            "pexels.com",
-            "unsplash.com", 
-            "cloudinary.com",
-            "imgix.net",
-            "wp.com",
-            "wordpress.com",
-            "flickr.com",
-            "staticflickr.com",
-            "sidearm",  # Sidearm Sports CDN used by athletics sites
-            "prestosports",  # Presto Sports CDN
-            "bmcusports.com",  # Blue Mountain Christian athletics
-            "careyathletics.com",  # William Carey athletics
-            "nwccrangers.com",  # Northwest Mississippi CC athletics
-            "coahomasports.com",  # Coahoma CC athletics
-            "gostatesmen.com",  # Delta State athletics
-            "mvsusports.com",  # Mississippi Valley State athletics
-            "alcornsports.com",  # Alcorn State athletics
-            "gojsutigers.com",  # Jackson State athletics
-            "southernmiss.com",  # Southern Miss athletics
-            "hailstate.com",  # Mississippi State athletics
-            "olemisssports.com",  # Ole Miss athletics
-            "gochoctaws.com",  # Mississippi College athletics
-            "blazers.belhaven.edu",  # Belhaven University athletics
-            "gomajors.com",  # Millsaps College athletics
-            "owlsathletics.com",  # Mississippi University for Women athletics
-            "sports.hindscc.edu",  # Hinds Community College athletics
-            "jcbobcats.com",  # Jones College athletics
-            "southwestbearathletics.com",  # Southwest Mississippi Community College athletics
-            "bmcusports.com",  # Blue Mountain Christian University athletics
-        ]
-        for host in known_image_hosts:
-            if host in parsed.netloc.lower():
-                return True
+        if KNOWN_IMAGE_HOSTS_RE.search(netloc_lower):
+            return True
 
         return False
 
@@ -340,6 +645,58 @@ def is_valid_image_url(url: str) -> bool:
 
 
 
+def _image_from_media_content(items: list[dict[str, Any]]) -> Optional[str]:
+    """Get the first image URL from media:content items."""
+    for media in items:
+        # Typed (image/* or medium="image") and untyped items both qualify
+        # when the URL itself looks like an image
+        url = media.get("url", "")
+        if is_valid_image_url(url):
+            logger.debug("found_media_content_image", url=url)
+            return url
+    return None
+
+
+def _image_from_media_thumbnail(items: list[dict[str, Any]]) -> Optional[str]:
+    """Get the first image URL from media:thumbnail items."""
+    for thumb in items:
+        url = thumb.get("url", "")
+        if is_valid_image_url(url):
+            logger.debug("found_media_thumbnail", url=url)
+            return url
+    return None
+
+
+def _image_from_enclosures(items: list[dict[str, Any]]) -> Optional[str]:
+    """Get the first image URL from enclosures."""
+    for enclosure in items:
+        url = enclosure.get("href", "") or enclosure.get("url", "")
+        if url and (enclosure.get("type", "") in IMAGE_MIME_TYPES or is_valid_image_url(url)):
+            logger.debug("found_enclosure_image", url=url)
+            return url
+    return None
+
+
+def _image_from_links(items: list[dict[str, Any]]) -> Optional[str]:
+    """Get the first image-typed link URL."""
+    for link in items:
+        if link.get("type", "") in IMAGE_MIME_TYPES:
+            url = link.get("href", "")
+            if url:
+                logger.debug("found_link_image", url=url)
+                return url
+    return None
+
+
+# Entry fields checked for an image, in order of preference
+RSS_IMAGE_SOURCES = (
+    ("media_content", _image_from_media_content),
+    ("media_thumbnail", _image_from_media_thumbnail),
+    ("enclosures", _image_from_enclosures),
+    ("links", _image_from_links),
+)
+
+
 def find_rss_image(entry: dict[str, Any], base_url: str = "") -> Optional[str]:
     """Find an image URL from an RSS entry.
 
@@ -358,59 +715,20 @@ def find_rss_image(entry: dict[str, Any], base_url: str = "") -> Optional[str]:
     """
     image_url = None
 
-    # 1. Check media:content (media_content in feedparser)
-    if "media_content" in entry and entry["media_content"]:
-        for media in entry["media_content"]:
-            url = media.get("url", "")
-            media_type = media.get("type", "")
-            medium = media.get("medium", "")
-
-            # Check if it's an image
-            if media_type in IMAGE_MIME_TYPES or medium == "image":
-                if is_valid_image_url(url):
-                    image_url = url
-                    logger.debug("found_media_content_image", url=url)
-                    break
-            elif is_valid_image_url(url):
-                image_url = url
-                logger.debug("found_media_content_image", url=url)
+    # 1-4. media:content, media:thumbnail, enclosures, then typed links
+    for key, extract in RSS_IMAGE_SOURCES:
+        items = entry.get(key)
+        if items:
+            image_url = extract(items)
+            if image_url:
                 break
 
-    # 2. Check media:thumbnail (media_thumbnail in feedparser)
-    if not image_url and "media_thumbnail" in entry and entry["media_thumbnail"]:
-        for thumb in entry["media_thumbnail"]:
-            url = thumb.get("url", "")
-            if is_valid_image_url(url):
-                image_url = url
-                logger.debug("found_media_thumbnail", url=url)
-                break
-
-    # 3. Check enclosures
-    if not image_url and "enclosures" in entry and entry["enclosures"]:
-        for enclosure in entry["enclosures"]:
-            enc_type = enclosure.get("type", "")
-            url = enclosure.get("href", "") or enclosure.get("url", "")
-            if enc_type in IMAGE_MIME_TYPES or is_valid_image_url(url):
-                if url:
-                    image_url = url
-                    logger.debug("found_enclosure_image", url=url)
-                    break
-
-    # 4. Check links for image type
-    if not image_url and "links" in entry and entry["links"]:
-        for link in entry["links"]:
-            if link.get("type", "") in IMAGE_MIME_TYPES:
-                url = link.get("href", "")
-                if url:
-                    image_url = url
-                    logger.debug("found_link_image", url=url)
-                    break
-
     # 5. Parse images from content/summary HTML
     if not image_url:
         html_content = ""
-        if "content" in entry and entry["content"]:
-            html_content = entry["content"][0].get("value", "")
+        content = entry.get("content")
+        if content:
+            html_content = content[0].get("value", "")
         elif "summary" in entry:
             html_content = entry.get("summary", "")
         elif "description" in entry:
@@ -438,27 +756,17 @@ def extract_first_image_from_html(html: str, base_url: str = "") -> Optional[str
         Image URL or None.
     """
     try:
-        soup = BeautifulSoup(html, "html.parser")
+        tree = LexborHTMLParser(html)
 
         # Find all img tags
-        for img in soup.find_all("img"):
-            src = img.get("src", "")
+        for img in tree.css("img"):
+            src = img.attributes.get("src") or ""
             if not src:
                 continue
 
             # Skip common placeholder/tracking patterns
-            skip_patterns = [
-                "pixel",
-                "spacer",
-                "blank",
-                "1x1",
-                "tracking",
-                "beacon",
-                "analytics",
-                "gravatar",
-                "avatar",
-            ]
-            if any(pattern in src.lower() for pattern in skip_patterns):
+            src_lower = src.lower()
+            if any(pattern in src_lower for pattern in IMAGE_SKIP_PATTERNS):
                 continue
 
             # Resolve relative URLs
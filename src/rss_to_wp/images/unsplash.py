@@ -105,7 +105,7 @@ class UnsplashClient:
             )
 
             # Trigger download tracking (required by Unsplash API guidelines)
-            self._track_download(photo)
+            self.track_download(result["download_location"])
 
             return result
 
@@ -119,13 +119,14 @@ class UnsplashClient:
             logger.error("unsplash_error", error=str(e))
             return None
 
-    def _track_download(self, photo: dict) -> None:
+    def track_download(self, download_url: Optional[str]) -> None:
         """Track download as required by Unsplash API.
 
+        Must be called every time the photo is used.
+
         Args:
-            photo: Photo data from search results.
+            download_url: The photo's links.download_location URL.
         """
-        download_url = photo.get("links", {}).get("download_location")
         if not download_url:
             return
 
@@ -1,5 +1,6 @@
 """Storage module."""
 
 from rss_to_wp.storage.dedupe import DedupeStore
+from rss_to_wp.storage.feed_cache import FeedCache
 
-__all__ = ["DedupeStore"]
+__all__ = ["DedupeStore", "FeedCache"]
@@ -0,0 +1,125 @@
+"""SQLite-based cache for conditional feed requests."""
+
+from __future__ import annotations
+
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from rss_to_wp.config import get_data_dir
+from rss_to_wp.utils import get_logger
+
+logger = get_logger("storage.feed_cache")
+
+
+class FeedCache:
+    """SQLite-based store for feed validators (ETag/Last-Modified) and bodies.
+
+    Lives in the same database file as the DedupeStore by default, so it is
+    persisted between runs together with the processed entries.
+    """
+
+    def __init__(self, db_path: Optional[Path] = None):
+        """Initialize the feed cache.
+
+        Args:
+            db_path: Path to SQLite database. Defaults to data/processed.db
+        """
+        if db_path is None:
+            db_path = get_data_dir() / "processed.db"
+
+        self.db_path = db_path
+        self._init_db()
+
+    def _init_db(self) -> None:
+        """Initialize the database schema."""
+        with self._get_connection() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS feed_cache (
+                    feed_url TEXT PRIMARY KEY,
+                    etag TEXT,
+                    last_modified TEXT,
+                    content_type TEXT,
+                    body BLOB NOT NULL,
+                    fetched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            conn.commit()
+
+        logger.debug("feed_cache_initialized", path=str(self.db_path))
+
+    @contextmanager
+    def _get_connection(self):
+        """Get a database connection context manager."""
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def get(self, feed_url: str) -> Optional[dict]:
+        """Get the cached response for a feed.
+
+        Args:
+            feed_url: URL of the feed.
+
+        Returns:
+            Dictionary with etag, last_modified, content_type and body, or None.
+        """
+        with self._get_connection() as conn:
+            cursor = conn.execute(
+                """
+                SELECT etag, last_modified, content_type, body
+                FROM feed_cache WHERE feed_url = ?
+                """,
+                (feed_url,),
+            )
+            row = cursor.fetchone()
+
+        return dict(row) if row else None
+
+    def save(
+        self,
+        feed_url: str,
+        body: bytes,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        content_type: Optional[str] = None,
+    ) -> None:
+        """Store the latest response for a feed.
+
+        Responses without an ETag or Last-Modified header can never be
+        revalidated, so they are not stored.
+
+        Args:
+            feed_url: URL of the feed.
+            body: Raw response body.
+            etag: ETag response header.
+            last_modified: Last-Modified response header.
+            content_type: Content-Type response header.
+        """
+        if not etag and not last_modified:
+            return
+
+        with self._get_connection() as conn:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO feed_cache
+                (feed_url, etag, last_modified, content_type, body, fetched_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    feed_url,
+                    etag,
+                    last_modified,
+                    content_type,
+                    body,
+                    datetime.utcnow().isoformat(),
+                ),
+            )
+            conn.commit()
+
+        logger.debug("feed_cached", url=feed_url, etag=etag, last_modified=last_modified)
@@ -4,6 +4,7 @@ from rss_to_wp.utils.email import build_summary_email, send_email_notification
 from rss_to_wp.utils.http import (
     create_http_session,
     fetch_url_content,
+    get_shared_session,
     get_with_timeout,
     post_with_timeout,
 )
@@ -12,6 +13,7 @@ from rss_to_wp.utils.logging import get_logger, setup_logging
 __all__ = [
     "create_http_session",
     "fetch_url_content",
+    "get_shared_session",
     "get_with_timeout",
     "post_with_timeout",
     "get_logger",
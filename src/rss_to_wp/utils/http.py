@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Optional
 
 import requests
@@ -56,6 +57,32 @@ def create_http_session(
     return session
 
 
+@lru_cache(maxsize=1)
+def get_shared_session() -> requests.Session:
+    """Get the process-wide session used for feeds, scraping and image downloads.
+
+    Reusing one pooled session keeps TCP/TLS connections alive between
+    requests to the same host, including across worker threads. Transient
+    errors are retried inside urllib3.
+
+    Returns:
+        Shared requests.Session object.
+    """
+    session = requests.Session()
+
+    retry_strategy = Retry(
+        total=2,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+    )
+
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retry_strategy)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    return session
+
+
 def get_with_timeout(
     session: requests.Session,
     url: str,